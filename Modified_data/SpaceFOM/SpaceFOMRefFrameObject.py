@@ -45,13 +45,6 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
       # Save the frame name to use for trick_data_name generation.
       self.trick_frame_sim_obj_name = str( frame_S_define_instance_name )
       
-      # By SpaceFOM rule 5-1 the Reference Frame instance name must exactly
-      # match the Reference Frame name in the data.
-      if ( create_frame_object ) :
-         frame_S_define_instance.set_name( frame_instance_name )
-      else:
-         frame_S_define_instance.set_name( '' )
-
       # Call the base class constructor.
       TrickHLAObjectConfig.__init__( self,
                                      create_frame_object,
@@ -66,7 +59,8 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
                                      frame_thla_manager_object,
                                      frame_thread_IDs )
 
-      # Set the frame instance name.
+      # By SpaceFOM rule 5-1 the Reference Frame instance name must exactly
+      # match the Reference Frame name in the data.
       frame_S_define_instance.set_name( frame_instance_name )
 
       # Set the frame parent instance name.
@@ -98,6 +92,9 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
       # Short cut the sim_object name for the frame data.
       frame_instance_name = self.trick_frame_sim_obj_name
 
+      # All the frame attributes share the same configuration.
+      frame_config = trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC
+
       ## Set up the map to the reference frame's name.
       trick_data_name = str(frame_instance_name) + '.packing_data.name'
       attribute = TrickHLAAttributeConfig( 'name',
@@ -105,7 +102,7 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
                                            self.hla_create,
                                            not self.hla_create,
                                            self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
+                                           frame_config,
                                            trick.TrickHLA.ENCODING_UNICODE_STRING )
       self.add_attribute( attribute )
 
@@ -116,7 +113,7 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
                                            self.hla_create,
                                            not self.hla_create,
                                            self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
+                                           frame_config,
                                            trick.TrickHLA.ENCODING_UNICODE_STRING )
       self.add_attribute( attribute )
 
@@ -127,7 +124,7 @@ class SpaceFOMRefFrameObject(TrickHLAObjectConfig):
                                            self.hla_create,
                                            not self.hla_create,
                                            self.hla_create,
-                                           trick.TrickHLA.CONFIG_INITIALIZE + trick.TrickHLA.CONFIG_CYCLIC,
+                                           frame_config,
                                            trick.TrickHLA.ENCODING_NONE )
       self.add_attribute( attribute )
 
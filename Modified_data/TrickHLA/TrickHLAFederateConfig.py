@@ -348,6 +348,17 @@ class TrickHLAFederateConfig( object ):
       return
 
 
+   def add_sim_objects( self, sim_objects ):
+
+      # You can only add simulation objects before initialize method is called.
+      if self.initialized :
+         print( 'TrickHLAFederateConfig.add_sim_objects(): Warning, already initialized, function ignored!' )
+      else:
+         self.sim_objects.extend( sim_objects )
+
+      return
+
+
    def add_fed_object( self, fed_object ):
 
       # You can only add federation objects before initialize method is called.
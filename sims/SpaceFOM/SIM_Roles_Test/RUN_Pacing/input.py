@@ -64,10 +64,13 @@ def parse_command_line( ) :
    index = 2
    while (index < argc) :
       
-      if ((str(argv[index]) == '-h') | (str(argv[index]) == '--help')) :
+      # Convert the argument once for all the option checks.
+      arg = str(argv[index])
+      
+      if (arg in ('-h', '--help')) :
          print_usage = True
       
-      elif ((str(argv[index]) == '-f') | (str(argv[index]) == '--fed_name')) :
+      elif (arg in ('-f', '--fed_name')) :
          index = index + 1
          if (index < argc) :
             federate_name = str(argv[index])
@@ -75,7 +78,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fed_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-fe') | (str(argv[index]) == '--fex_name')) :
+      elif (arg in ('-fe', '--fex_name')) :
          index = index + 1
          if (index < argc) :
             federation_name = str(argv[index])
@@ -83,7 +86,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fex_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-m') | (str(argv[index]) == '--master')) :
+      elif (arg in ('-m', '--master')) :
          index = index + 1
          if (index < argc) :
             master_name = str(argv[index])
@@ -91,7 +94,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --master [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-r') | (str(argv[index]) == '--rrfp')) :
+      elif (arg in ('-r', '--rrfp')) :
          index = index + 1
          if (index < argc) :
             rrfp_name = str(argv[index])
@@ -99,10 +102,10 @@ def parse_command_line( ) :
             print('ERROR: Missing --rrfp [name] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '-nostop') :
+      elif (arg == '-nostop') :
          run_duration = None
       
-      elif ((str(argv[index]) == '-s') | (str(argv[index]) == '--stop')) :
+      elif (arg in ('-s', '--stop')) :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -110,7 +113,7 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
       
-      elif (str(argv[index]) == '--verbose') :
+      elif (arg == '--verbose') :
          index = index + 1
          if (index < argc) :
             if (str(argv[index]) == 'on') :
@@ -124,12 +127,12 @@ def parse_command_line( ) :
             print('ERROR: Missing --verbose [on|off] argument.')
             print_usage = True
          
-      elif ((str(argv[index]) == '-d')) :
+      elif (arg == '-d') :
          # Pass this on to Trick.
          break
             
       else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
+         print('ERROR: Unknown command line argument ' + arg)
          print_usage = True
          
       index = index + 1
@@ -14,35 +14,75 @@
 #    (((Edwin Z. Crues) (NASA/ER7) (Jan 2019) (--) (SpaceFOM support and testing.)))
 ##############################################################################
 import sys
+import argparse
 sys.path.append('../../../')
 
-# Load the SpaceFOM specific federate configuration object.
-from Modified_data.SpaceFOM.SpaceFOMFederateConfig import *
-
-# Load the SpaceFOM specific reference frame configuration object.
-from Modified_data.SpaceFOM.SpaceFOMRefFrameObject import *
+# Pitch specific CRC local settings designator.
+CRC_LOCAL_SETTINGS = 'crcHost = localhost\n crcPort = 8989'
+
+# Debug output levels for verbose on and off.
+DEBUG_LEVEL_ON  = trick.TrickHLA.DEBUG_LEVEL_4_TRACE
+DEBUG_LEVEL_OFF = trick.TrickHLA.DEBUG_LEVEL_0_TRACE
+
+# Command line usage message.
+USAGE_MESSAGE = ( ' \n'
+                  'TrickHLA SpaceFOM Roles Test Simulation Command Line Configuration Options:\n'
+                  '  -h --help             : Print this help message.\n'
+                  '  -f --fed_name [name]  : Name of the Federate, default is PhysicalEntity.\n'
+                  '  -fe --fex_name [name] : Name of the Federation Execution, default is SpaceFOM_Roles_Test.\n'
+                  '  -m --master [name]    : Name of the Master federate, default is Master.\n'
+                  '  --nostop              : Set no stop time on simulation.\n'
+                  '  -p --pacing [name]    : Name of the Pacing federate, default is Pacing.\n'
+                  '  -r --root_frame [name]: Name of the Root Reference Frame, default is RootFrame.\n'
+                  '  -s --stop [time]      : Time to stop simulation, default is 10.0 seconds.\n'
+                  '  --verbose [on|off]    : on: Show verbose messages (Default), off: disable messages.\n'
+                  ' \n' )
 
 def print_usage_message( ):
 
-   print(' ')
-   print('TrickHLA SpaceFOM Roles Test Simulation Command Line Configuration Options:')
-   print('  -h --help             : Print this help message.')
-   print('  -f --fed_name [name]  : Name of the Federate, default is PhysicalEntity.')
-   print('  -fe --fex_name [name] : Name of the Federation Execution, default is SpaceFOM_Roles_Test.')
-   print('  -m --master [name]    : Name of the Master federate, default is Master.')
-   print('  --nostop              : Set no stop time on simulation.')
-   print('  -p --pacing [name]    : Name of the Pacing federate, default is Pacing.')
-   print('  -s --stop [time]      : Time to stop simulation, default is 10.0 seconds.')
-   print('  --verbose [on|off]    : on: Show verbose messages (Default), off: disable messages.')
-   print(' ')
+   sys.stdout.write( USAGE_MESSAGE )
+   sys.stdout.flush()
 
+   frame = sys._getframe(0)
    trick.exec_terminate_with_return( -1,
-                                     sys._getframe(0).f_code.co_filename,
-                                     sys._getframe(0).f_lineno,
+                                     frame.f_code.co_filename,
+                                     frame.f_lineno,
                                      'Print usage message.')
    return
 
 
+# Map of on|off option values to their settings.
+_ON_OFF = { 'on' : True, 'off' : False }
+
+# Command line parser that reports errors without its own usage text.
+class CommandLineParser( argparse.ArgumentParser ):
+
+   def error( self, message ):
+
+      # Report the problem in the same form as the other input files and
+      # leave the usage text to print_usage_message().
+      print('ERROR: ' + message)
+      self.exit( 2 )
+
+
+# Command line parser, built once when the input file is loaded. The
+# parser looks each option up in its own option string table, so there is
+# no per-option comparison chain to walk for each argument.
+_PARSER = CommandLineParser( prog = 'RUN_RRFP/input.py',
+                             add_help = False,
+                             allow_abbrev = False )
+_PARSER.add_argument( '-h', '--help', dest = 'print_usage', action = 'store_true' )
+_PARSER.add_argument( '-f', '--fed_name', dest = 'federate_name' )
+_PARSER.add_argument( '-fe', '--fex_name', dest = 'federation_name' )
+_PARSER.add_argument( '-m', '--master', dest = 'master_name' )
+_PARSER.add_argument( '-p', '--pacing', dest = 'pacing_name' )
+_PARSER.add_argument( '-r', '--root_frame', dest = 'root_frame_name' )
+_PARSER.add_argument( '-s', '--stop', dest = 'run_duration', type = float )
+_PARSER.add_argument( '--nostop', '-nostop', dest = 'run_duration',
+                      action = 'store_const', const = None )
+_PARSER.add_argument( '--verbose', choices = _ON_OFF )
+
+
 def parse_command_line( ) :
    
    global print_usage
@@ -52,96 +92,103 @@ def parse_command_line( ) :
    global federation_name
    global master_name
    global pacing_name
-   global rrfp_name
+   global root_frame_name
    
-   # Get the Trick command line arguments.
+   # Get the Trick command line arguments as Python strings, reading
+   # each one across the Trick interface only once.
    argc = trick.command_line_args_get_argc()
    argv = trick.command_line_args_get_argv()
+   args = [ str(argv[index]) for index in range( argc ) ]
    
-   # Process the command line arguments.
+   # Keep only the arguments for this input file.
    # argv[0]=S_main*.exe, argv[1]=RUN/input.py file
-   index = 2
-   while (index < argc) :
-      
-      if ((str(argv[index]) == '-h') | (str(argv[index]) == '--help')) :
-         print_usage = True
-      
-      elif ((str(argv[index]) == '-f') | (str(argv[index]) == '--fed_name')) :
-         index = index + 1
-         if (index < argc) :
-            federate_name = str(argv[index])
-         else :
-            print('ERROR: Missing --fed_name [name] argument.')
-            print_usage = True
-      
-      elif ((str(argv[index]) == '-fe') | (str(argv[index]) == '--fex_name')) :
-         index = index + 1
-         if (index < argc) :
-            federation_name = str(argv[index])
-         else :
-            print('ERROR: Missing --fex_name [name] argument.')
-            print_usage = True
-      
-      elif ((str(argv[index]) == '-m') | (str(argv[index]) == '--master')) :
-         index = index + 1
-         if (index < argc) :
-            master_name = str(argv[index])
-         else :
-            print('ERROR: Missing --master [name] argument.')
-            print_usage = True 
-      
-      elif ((str(argv[index]) == '-p') | (str(argv[index]) == '--pacing')) :
-         index = index + 1
-         if (index < argc) :
-            pacing_name = str(argv[index])
-         else :
-            print('ERROR: Missing --pacing [name] argument.')
-            print_usage = True
-            
-      elif (str(argv[index]) == '-nostop') :
-         run_duration = None
-      
-      elif ((str(argv[index]) == '-r') | (str(argv[index]) == '--root_frame')) :
-         index = index + 1
-         if (index < argc) :
-            root_frame_name = str(argv[index])
-         else :
-            print('ERROR: Missing --root_frame [name] argument.')
-            print_usage = True
-      
-      elif ((str(argv[index]) == '-s') | (str(argv[index]) == '--stop')) :
-         index = index + 1
-         if (index < argc) :
-            run_duration = float(str(argv[index]))
-         else :
-            print('ERROR: Missing -stop [time] argument.')
-            print_usage = True
-      
-      elif (str(argv[index]) == '--verbose') :
-         index = index + 1
-         if (index < argc) :
-            if (str(argv[index]) == 'on') :
-               verbose = True
-            elif (str(argv[index]) == 'off') :
-               verbose = False
-            else :
-               print('ERROR: Unknown --verbose argument: ' + str(argv[index]))
-               print_usage = True
-         else :
-            print('ERROR: Missing --verbose [on|off] argument.')
-            print_usage = True
-         
-      elif ((str(argv[index]) == '-d')) :
-         # Pass this on to Trick.
-         break
-         
-      else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
-         print_usage = True
-         
-      index = index + 1
+   # Everything from '-d' on is passed on to Trick.
+   args = args[2:]
+   if '-d' in args :
+      args = args[:args.index( '-d' )]
+   
+   # Seed the parse with the current settings so that only the options
+   # present on the command line change them.
+   ns = argparse.Namespace( print_usage     = print_usage,
+                            run_duration    = run_duration,
+                            verbose         = 'on' if verbose else 'off',
+                            federate_name   = federate_name,
+                            federation_name = federation_name,
+                            master_name     = master_name,
+                            pacing_name     = pacing_name,
+                            root_frame_name = root_frame_name )
+   
+   # The parser prints an error for missing or bad option values and exits.
+   try :
+      ns, unknown_args = _PARSER.parse_known_args( args, namespace = ns )
+   except SystemExit :
+      print_usage = True
+      return
+   
+   for arg in unknown_args :
+      print('ERROR: Unknown command line argument ' + arg)
+      ns.print_usage = True
+   
+   print_usage     = ns.print_usage
+   run_duration    = ns.run_duration
+   verbose         = _ON_OFF[ns.verbose]
+   federate_name   = ns.federate_name
+   federation_name = ns.federation_name
+   master_name     = ns.master_name
+   pacing_name     = ns.pacing_name
+   root_frame_name = ns.root_frame_name
+   
    return
 
+
+#---------------------------------------------------------------------------
+# Reference frame data initialization.
+#---------------------------------------------------------------------------
+class FrameInit( object ):
+
+   # Fixed set of frame initialization settings.
+   __slots__ = ( 'name', 'parent_name', 'pos', 'vel',
+                 'att_scalar', 'att_vector', 'ang_vel', 'time' )
+
+   def __init__( self,
+                 name,
+                 parent_name,
+                 pos        = ( 0.0, 0.0, 0.0 ),
+                 vel        = ( 0.0, 0.0, 0.0 ),
+                 att_scalar = 1.0,
+                 att_vector = ( 0.0, 0.0, 0.0 ),
+                 ang_vel    = ( 0.0, 0.0, 0.0 ),
+                 time       = 0.0 ):
+
+      self.name        = name
+      self.parent_name = parent_name
+      self.pos         = list( pos )
+      self.vel         = list( vel )
+      self.att_scalar  = att_scalar
+      self.att_vector  = list( att_vector )
+      self.ang_vel     = list( ang_vel )
+      self.time        = time
+
+      return
+
+
+   def apply( self, frame_data ):
+
+      frame_data.name = self.name
+      frame_data.parent_name = self.parent_name
+
+      # Resolve the frame state once and set it a whole vector at a time.
+      state = frame_data.state
+      state.pos = self.pos
+      state.vel = self.vel
+      state.att.scalar = self.att_scalar
+      state.att.vector = self.att_vector
+      state.ang_vel = self.ang_vel
+      state.time = self.time
+
+      return
+
+
 # Default: Don't show usage.
 print_usage = False
 
@@ -166,6 +213,9 @@ pacing_name = 'Pacing'
 # Set the default Root Reference Frame name.
 root_frame_name = 'RootFrame'
 
+# Set the default vehicle reference frame name.
+frame_A_name = 'FrameA'
+
 
 parse_command_line()
 
@@ -193,6 +243,15 @@ trick.sim_control_panel_set_enabled(False)
 # =========================================================================
 # Set up the HLA interfaces.
 # =========================================================================
+# The SpaceFOM configuration modules are loaded here, after the command line
+# is processed, so that printing the usage message does not load them.
+
+# Load the SpaceFOM specific federate configuration object.
+from Modified_data.SpaceFOM.SpaceFOMFederateConfig import SpaceFOMFederateConfig
+
+# Load the SpaceFOM specific reference frame configuration object.
+from Modified_data.SpaceFOM.SpaceFOMRefFrameObject import SpaceFOMRefFrameObject
+
 # Instantiate the Python SpaceFOM configuration object.
 federate = SpaceFOMFederateConfig( THLA.federate,
                                    THLA.manager,
@@ -208,10 +267,7 @@ federate = SpaceFOMFederateConfig( THLA.federate,
 #federate.set_ExCO_S_define_name( 'THLA_INIT.ExCO' )
 
 # Set the debug output level.
-if (verbose == True) : 
-   federate.set_debug_level( trick.TrickHLA.DEBUG_LEVEL_4_TRACE )
-else :
-   federate.set_debug_level( trick.TrickHLA.DEBUG_LEVEL_0_TRACE )
+federate.set_debug_level( DEBUG_LEVEL_ON if verbose else DEBUG_LEVEL_OFF )
 
 #--------------------------------------------------------------------------
 # Configure this federate SpaceFOM roles for this federate.
@@ -233,7 +289,7 @@ federate.set_RRFP_role( True )    # This is the Root Reference Frame Publisher.
 # Configure the CRC.
 #--------------------------------------------------------------------------
 # Pitch specific local settings designator:
-THLA.federate.local_settings = 'crcHost = localhost\n crcPort = 8989'
+THLA.federate.local_settings = CRC_LOCAL_SETTINGS
 #THLA.federate.local_settings = 'crcHost = js-er7-rti-dev.jsc.nasa.gov\n crcPort = 8989'
 
 #--------------------------------------------------------------------------
@@ -265,44 +321,15 @@ federate.set_time_constrained( True )
 
 
 #---------------------------------------------------------------------------
-# Set up for Root Reference Frame data.
+# Set up for Root Reference Frame and vehicle frame data.
 #---------------------------------------------------------------------------
-ref_frame_tree.root_frame_data.name = root_frame_name
-ref_frame_tree.root_frame_data.parent_name = ''
-                                        
-ref_frame_tree.root_frame_data.state.pos[0] = 0.0
-ref_frame_tree.root_frame_data.state.pos[1] = 0.0
-ref_frame_tree.root_frame_data.state.pos[2] = 0.0
-ref_frame_tree.root_frame_data.state.vel[0] = 0.0
-ref_frame_tree.root_frame_data.state.vel[1] = 0.0
-ref_frame_tree.root_frame_data.state.vel[2] = 0.0
-ref_frame_tree.root_frame_data.state.att.scalar  = 1.0
-ref_frame_tree.root_frame_data.state.att.vector[0] = 0.0
-ref_frame_tree.root_frame_data.state.att.vector[1] = 0.0
-ref_frame_tree.root_frame_data.state.att.vector[2] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[0] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[1] = 0.0
-ref_frame_tree.root_frame_data.state.ang_vel[2] = 0.0
-ref_frame_tree.root_frame_data.state.time = 0.0
-
-
-ref_frame_tree.vehicle_frame_data.name = 'FrameA'
-ref_frame_tree.vehicle_frame_data.parent_name = root_frame_name
-                                        
-ref_frame_tree.vehicle_frame_data.state.pos[0] = 10.0
-ref_frame_tree.vehicle_frame_data.state.pos[1] = 10.0
-ref_frame_tree.vehicle_frame_data.state.pos[2] = 10.0
-ref_frame_tree.vehicle_frame_data.state.vel[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.vel[1] = 0.1
-ref_frame_tree.vehicle_frame_data.state.vel[2] = 0.0
-ref_frame_tree.vehicle_frame_data.state.att.scalar  = 1.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[1] = 0.0
-ref_frame_tree.vehicle_frame_data.state.att.vector[2] = 0.0
-ref_frame_tree.vehicle_frame_data.state.ang_vel[0] = 0.0
-ref_frame_tree.vehicle_frame_data.state.ang_vel[1] = 0.1
-ref_frame_tree.vehicle_frame_data.state.ang_vel[2] = 0.0
-ref_frame_tree.vehicle_frame_data.state.time = 0.0
+FrameInit( root_frame_name, '' ).apply( ref_frame_tree.root_frame_data )
+
+FrameInit( frame_A_name,
+           root_frame_name,
+           pos     = ( 10.0, 10.0, 10.0 ),
+           vel     = ( 0.0, 0.1, 0.0 ),
+           ang_vel = ( 0.0, 0.1, 0.0 ) ).apply( ref_frame_tree.vehicle_frame_data )
 
 
 #---------------------------------------------------------------------------
@@ -311,7 +338,7 @@ ref_frame_tree.vehicle_frame_data.state.time = 0.0
 # If it is NOT the RRFP, it will subscribe to the frame.
 #---------------------------------------------------------------------------
 root_frame = SpaceFOMRefFrameObject( federate.is_RRFP,
-                                     'RootFrame',
+                                     root_frame_name,
                                      root_ref_frame.frame_packing,
                                      'root_ref_frame.frame_packing' )
 
@@ -325,7 +352,7 @@ federate.set_root_frame( root_frame )
 # Set up an alternate vehicle reference frame object for discovery.
 #---------------------------------------------------------------------------
 frame_A = SpaceFOMRefFrameObject( True,
-                                  'FrameA',
+                                  frame_A_name,
                                   ref_frame_A.frame_packing,
                                   'ref_frame_A.frame_packing',
                                   parent_S_define_instance = root_ref_frame.frame_packing,
@@ -354,10 +381,7 @@ frame_A.set_lag_comp_type( trick.TrickHLA.LAG_COMPENSATION_RECEIVE_SIDE )
 # This is really only useful for turning on and off HLA objects.
 # This doesn't really apply to these example simulations which are only HLA.
 #---------------------------------------------------------------------------
-federate.add_sim_object( THLA )
-federate.add_sim_object( THLA_INIT )
-federate.add_sim_object( root_ref_frame )
-federate.add_sim_object( ref_frame_A )
+federate.add_sim_objects( [ THLA, THLA_INIT, root_ref_frame, ref_frame_A ] )
 
 
 #---------------------------------------------------------------------------
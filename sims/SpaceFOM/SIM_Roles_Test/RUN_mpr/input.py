@@ -60,10 +60,13 @@ def parse_command_line( ) :
    index = 2
    while (index < argc) :
       
-      if ((str(argv[index]) == '-h') | (str(argv[index]) == '--help')) :
+      # Convert the argument once for all the option checks.
+      arg = str(argv[index])
+      
+      if (arg in ('-h', '--help')) :
          print_usage = True
       
-      elif ((str(argv[index]) == '-f') | (str(argv[index]) == '--fed_name')) :
+      elif (arg in ('-f', '--fed_name')) :
          index = index + 1
          if (index < argc) :
             federate_name = str(argv[index])
@@ -71,7 +74,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fed_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-fe') | (str(argv[index]) == '--fex_name')) :
+      elif (arg in ('-fe', '--fex_name')) :
          index = index + 1
          if (index < argc) :
             federation_name = str(argv[index])
@@ -79,7 +82,7 @@ def parse_command_line( ) :
             print('ERROR: Missing --fex_name [name] argument.')
             print_usage = True
       
-      elif ((str(argv[index]) == '-r') | (str(argv[index]) == '--root_frame')) :
+      elif (arg in ('-r', '--root_frame')) :
          index = index + 1
          if (index < argc) :
             root_frame_name = str(argv[index])
@@ -87,10 +90,10 @@ def parse_command_line( ) :
             print('ERROR: Missing --root_frame [name] argument.')
             print_usage = True
             
-      elif (str(argv[index]) == '--nostop') :
+      elif (arg == '--nostop') :
          run_duration = None
       
-      elif ((str(argv[index]) == '-s') | (str(argv[index]) == '--stop')) :
+      elif (arg in ('-s', '--stop')) :
          index = index + 1
          if (index < argc) :
             run_duration = float(str(argv[index]))
@@ -98,7 +101,7 @@ def parse_command_line( ) :
             print('ERROR: Missing -stop [time] argument.')
             print_usage = True
       
-      elif (str(argv[index]) == '--verbose') :
+      elif (arg == '--verbose') :
          index = index + 1
          if (index < argc) :
             if (str(argv[index]) == 'on') :
@@ -112,12 +115,12 @@ def parse_command_line( ) :
             print('ERROR: Missing --verbose [on|off] argument.')
             print_usage = True
          
-      elif ((str(argv[index]) == '-d')) :
+      elif (arg == '-d') :
          # Pass this on to Trick.
          break
             
       else :
-         print('ERROR: Unknown command line argument ' + str(argv[index]))
+         print('ERROR: Unknown command line argument ' + arg)
          print_usage = True
          
       index = index + 1